@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
+from flask_compress import Compress
 import os
+import shutil
 import threading
+import queue
 import time
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from webshare_api import WebshareAPI
 import logging
 
@@ -15,11 +20,38 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
 
+# Compress JSON responses - file listings shrink several times over slow Wi-Fi
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
+
+def fast_json(obj, status=200):
+    """JSON response encoded with orjson for frequently polled endpoints"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
 # Initialize Webshare API client
 webshare_client = WebshareAPI()
 
 # Track active downloads
 active_downloads = {}
+_downloads_lock = threading.Lock()
+# Signalled whenever a download entry is published, wakes progress streams
+_downloads_changed = threading.Condition(_downloads_lock)
+
+# Finished downloads stay visible to progress polls for this many seconds
+DOWNLOAD_RETENTION = 30
+
+# Keep-alive session for Plex API calls - the Plex host never changes
+plex_session = requests.Session()
+plex_session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+plex_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# Library sections waiting for a debounced Plex refresh
+plex_refresh_queue = queue.Queue()
+
+# Cached /api/downloads listing, invalidated when a media directory changes
+_downloads_cache = {'movies_mtime': 0, 'series_mtime': 0, 'files': None, 'generation': 0}
+_downloads_cache_lock = threading.Lock()
 
 # Get credentials and download path from environment variables
 WEBSHARE_USERNAME = os.environ.get('WEBSHARE_USERNAME')
@@ -31,6 +63,40 @@ SERIES_PATH = os.environ.get('SERIES_PATH', '/downloads/series')
 # Plex configuration for triggering library refresh
 PLEX_URL = os.environ.get('PLEX_URL', 'http://plex:32400')
 PLEX_TOKEN = os.environ.get('PLEX_TOKEN', '')
+PLEX_REFRESH_DEBOUNCE = 10  # minimum seconds between library refreshes
+
+# Per content type settings - download directory and Plex library section to refresh
+CONTENT_PATHS = {
+    'movie': MOVIES_PATH,
+    'series': SERIES_PATH
+}
+MEDIA_TYPE_LABELS = {
+    'movie': '🎬 Movie',
+    'series': '📺 Series'
+}
+PLEX_SECTION_IDS = {
+    'movie': os.environ.get('PLEX_MOVIES_SECTION', 'all'),
+    'series': os.environ.get('PLEX_SERIES_SECTION', 'all')
+}
+
+# Download tuning - large chunks keep the write loop I/O-bound instead of syscall-bound
+DOWNLOAD_CHUNK_SIZE = int(os.environ.get('DOWNLOAD_CHUNK_SIZE', 262144))
+PROGRESS_UPDATE_INTERVAL = 0.5  # seconds between progress updates
+SSE_HEARTBEAT_INTERVAL = 30  # seconds between keepalives on idle progress streams
+# Each open progress stream holds a server thread and a browser connection, so keep them scarce
+MAX_PROGRESS_STREAMS = int(os.environ.get('MAX_PROGRESS_STREAMS', 2))
+# Preallocate download targets - off by default because glibc emulates it by writing
+# every block on filesystems without native fallocate (NTFS-3g, CIFS)
+DOWNLOAD_PREALLOCATE = os.environ.get('DOWNLOAD_PREALLOCATE', 'False').lower() == 'true'
+# Evict finished downloads from the page cache so they don't push out Plex's working set
+DOWNLOAD_DROP_PAGE_CACHE = os.environ.get('DOWNLOAD_DROP_PAGE_CACHE', 'True').lower() == 'true'
+MAX_PARALLEL_DOWNLOADS = int(os.environ.get('MAX_PARALLEL_DOWNLOADS', 3))
+
+# Jobs for the persistent download workers - a fixed worker count keeps bursts from saturating the Pi's NIC and disk
+download_queue = queue.Queue()
+
+# Free slots for open progress streams
+_progress_streams = threading.BoundedSemaphore(MAX_PROGRESS_STREAMS)
 
 # Auto-login on startup if credentials are provided
 login_status = "not_configured"
@@ -45,11 +111,106 @@ if WEBSHARE_USERNAME and WEBSHARE_PASSWORD:
     except Exception as e:
         login_status = "error"
         login_message = f"Login failed: {str(e)}"
-        logger.error(f"Auto-login failed: {str(e)}")
+        logger.error("Auto-login failed: %s", e)
 else:
     login_status = "not_configured"
     login_message = "Webshare.cz credentials not configured"
 
+def _sweep_expired_downloads():
+    """Drop finished downloads whose retention period has passed"""
+    now = time.time()
+    with _downloads_lock:
+        for file_id, entry in list(active_downloads.items()):
+            expires_at = entry.get('expires_at')
+            if expires_at and expires_at < now:
+                active_downloads.pop(file_id, None)
+
+def _download_sweeper():
+    """Single janitor thread that expires finished downloads"""
+    while True:
+        time.sleep(DOWNLOAD_RETENTION / 3)
+        try:
+            _sweep_expired_downloads()
+        except Exception as e:
+            logger.error('Download sweeper error: %s', e)
+
+threading.Thread(target=_download_sweeper, daemon=True).start()
+
+def schedule_plex_refresh(section_key):
+    """Request a Plex refresh of a library section, coalescing bursts of requests"""
+    plex_refresh_queue.put(section_key)
+
+def _plex_refresh_worker():
+    """Single thread that fires at most one round of Plex refreshes per debounce interval"""
+    last_refresh = 0.0
+    while True:
+        sections = {plex_refresh_queue.get()}
+        time.sleep(max(0, PLEX_REFRESH_DEBOUNCE - (time.monotonic() - last_refresh)))
+        
+        # Coalesce everything that arrived while waiting into one round of refreshes
+        while True:
+            try:
+                sections.add(plex_refresh_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # A full refresh already covers every individual section
+        if 'all' in sections:
+            sections = {'all'}
+        
+        for section_key in sections:
+            try:
+                refresh_url = f'{PLEX_URL}/library/sections/{section_key}/refresh?X-Plex-Token={PLEX_TOKEN}'
+                response = plex_session.put(refresh_url, timeout=5)
+                if response.status_code == 200:
+                    logger.info('Successfully triggered Plex library refresh for section %s', section_key)
+                else:
+                    logger.warning('Plex API returned status code: %s', response.status_code)
+            except Exception as e:
+                logger.error('Error triggering Plex library refresh: %s', e)
+        
+        last_refresh = time.monotonic()
+
+threading.Thread(target=_plex_refresh_worker, daemon=True).start()
+
+def _publish_download(file_id, **fields):
+    """Publish an updated copy of a download entry in a single assignment.
+
+    Entries are never mutated in place, so readers can hold a reference to a
+    consistent snapshot without taking the lock.
+    """
+    with _downloads_lock:
+        active_downloads[file_id] = {**active_downloads.get(file_id, {}), **fields}
+        _downloads_changed.notify_all()
+
+def _dir_mtime(path):
+    """Return directory modification time in ns, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+def _invalidate_downloads_cache():
+    """Force the next /api/downloads request to rescan the media directories"""
+    with _downloads_cache_lock:
+        _downloads_cache['files'] = None
+        _downloads_cache['generation'] += 1
+
+def _scan_media_dir(dir_path, type_key, names, sizes, mtimes, types):
+    """Append regular files in a media directory to parallel lists using a single scandir pass"""
+    if not os.path.exists(dir_path):
+        return
+    
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            names.append(entry.name)
+            sizes.append(stat.st_size)
+            mtimes.append(stat.st_mtime)
+            types.append(type_key)
+
 @app.route('/')
 def index():
     """Main page with search form"""
@@ -70,13 +231,13 @@ def login():
             return jsonify({'success': False, 'error': 'No credentials configured'}), 400
     
     except Exception as e:
-        logger.error(f'Login error: {str(e)}')
+        logger.error('Login error: %s', e)
         return jsonify({'success': False, 'error': str(e)}), 400
 
 @app.route('/api/status')
 def status():
     """Get login status"""
-    return jsonify({
+    return fast_json({
         'logged_in': webshare_client.logged_in,
         'credentials_configured': bool(WEBSHARE_USERNAME and WEBSHARE_PASSWORD),
         'login_status': login_status,
@@ -98,20 +259,53 @@ def search():
         return jsonify({'success': True, 'results': results})
     
     except Exception as e:
-        logger.error(f'Search error: {str(e)}')
+        logger.error('Search error: %s', e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def download_file_background(file_id, file_name, download_path):
+class _ProgressWriter:
+    """File wrapper that publishes throttled download progress as chunks are written"""
+    
+    def __init__(self, f, file_id, total_size):
+        self.f = f
+        self.file_id = file_id
+        self.total_size = total_size
+        self.downloaded_size = 0
+        self.last_progress = -1
+        self.last_update = 0.0
+    
+    def write(self, chunk):
+        written = self.f.write(chunk)
+        self.downloaded_size += len(chunk)
+        
+        # Update progress (throttled - clients only poll a few times per second)
+        if self.total_size > 0:
+            progress = min(90, 10 + int((self.downloaded_size / self.total_size) * 80))
+            now = time.monotonic()
+            if progress != self.last_progress and now - self.last_update > PROGRESS_UPDATE_INTERVAL:
+                _publish_download(
+                    self.file_id,
+                    progress=progress,
+                    message=f'Downloading... {progress-10}%',
+                    downloadedSize=self.downloaded_size
+                )
+                self.last_progress = progress
+                self.last_update = now
+        
+        return written
+
+def download_file_background(file_id, file_name, content_type):
     """Background download function"""
     try:
         # Update status to downloading
-        active_downloads[file_id] = {
-            'status': 'downloading',
-            'fileName': file_name,
-            'progress': 0,
-            'message': 'Starting download...',
-            'startTime': time.time()
-        }
+        with _downloads_lock:
+            active_downloads[file_id] = {
+                'status': 'downloading',
+                'fileName': file_name,
+                'progress': 0,
+                'message': 'Starting download...',
+                'startTime': time.time()
+            }
+            _downloads_changed.notify_all()
         
         # Get download info first
         download_info = webshare_client.initiate_download(file_id)
@@ -122,88 +316,116 @@ def download_file_background(file_id, file_name, download_path):
             file_name = download_info['fileName']
         
         # Ensure download directory exists
+        download_path = CONTENT_PATHS[content_type]
         os.makedirs(download_path, exist_ok=True)
         
         # Full file path
         file_path = os.path.join(download_path, file_name)
         
         # Update status
-        active_downloads[file_id]['message'] = 'Connecting to server...'
-        active_downloads[file_id]['progress'] = 5
+        _publish_download(file_id, message='Connecting to server...', progress=5)
         
         # Download the file with progress tracking
-        logger.info(f'Starting download of {file_name}...')
+        logger.info('Starting download of %s...', file_name)
         
         response = webshare_client.session.get(download_url, stream=True)
         response.raise_for_status()
         
         total_size = int(response.headers.get('content-length', expected_size or 0))
-        downloaded_size = 0
         
-        active_downloads[file_id]['message'] = f'Downloading... 0%'
-        active_downloads[file_id]['progress'] = 10
-        active_downloads[file_id]['totalSize'] = total_size
+        _publish_download(file_id, message='Downloading... 0%', progress=10, totalSize=total_size)
+        
+        # Stream the raw body straight to disk; only decode if the server compressed it
+        response.raw.decode_content = bool(response.headers.get('content-encoding'))
         
         with open(file_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
-                    
-                    # Update progress
-                    if total_size > 0:
-                        progress = min(90, 10 + int((downloaded_size / total_size) * 80))
-                        active_downloads[file_id]['progress'] = progress
-                        active_downloads[file_id]['message'] = f'Downloading... {progress-10}%'
-                        active_downloads[file_id]['downloadedSize'] = downloaded_size
+            # Reserve contiguous extents up front to limit fragmentation and metadata churn
+            preallocated = False
+            if DOWNLOAD_PREALLOCATE and total_size > 0:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                    preallocated = True
+                except (AttributeError, OSError):
+                    pass
+            
+            writer = _ProgressWriter(f, file_id, total_size)
+            try:
+                shutil.copyfileobj(response.raw, writer, length=DOWNLOAD_CHUNK_SIZE)
+            finally:
+                # Drop the preallocated tail, also when the transfer fails partway,
+                # so a short or broken download never looks like a complete file
+                if preallocated:
+                    f.truncate(writer.downloaded_size)
+            downloaded_size = writer.downloaded_size
+            
+            # Dirty pages can't be dropped, so flush them to disk before advising the kernel
+            if DOWNLOAD_DROP_PAGE_CACHE and hasattr(os, 'posix_fadvise'):
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError as e:
+                    logger.warning('Could not drop page cache for %s: %s', file_name, e)
         
         # Set proper file permissions (readable by group and others)
         try:
             os.chmod(file_path, 0o644)
-            logger.info(f'Set file permissions to 644 for {file_name}')
+            logger.info('Set file permissions to 644 for %s', file_name)
         except Exception as e:
-            logger.warning(f'Could not set file permissions for {file_name}: {str(e)}')
+            logger.warning('Could not set file permissions for %s: %s', file_name, e)
+        
+        size_formatted = webshare_client._format_file_size(downloaded_size)
         
         # Final status update
-        active_downloads[file_id]['status'] = 'completed'
-        active_downloads[file_id]['progress'] = 100
-        active_downloads[file_id]['message'] = 'Download completed!'
-        active_downloads[file_id]['filePath'] = file_path
-        active_downloads[file_id]['finalSize'] = downloaded_size
+        _publish_download(
+            file_id,
+            status='completed',
+            progress=100,
+            message='Download completed!',
+            filePath=file_path,
+            finalSize=downloaded_size,
+            sizeFormatted=size_formatted,
+            expires_at=time.time() + DOWNLOAD_RETENTION
+        )
         
-        logger.info(f'Download completed: {file_name} ({webshare_client._format_file_size(downloaded_size)})')
+        # File size changed without touching the directory mtime
+        _invalidate_downloads_cache()
+        
+        logger.info('Download completed: %s (%s)', file_name, size_formatted)
         
         # Trigger Plex library refresh after successful download
         if PLEX_TOKEN:
-            try:
-                refresh_url = f'{PLEX_URL}/library/sections/all/refresh?X-Plex-Token={PLEX_TOKEN}'
-                response = requests.put(refresh_url, timeout=5)
-                if response.status_code == 200:
-                    logger.info('Successfully triggered Plex library refresh')
-                else:
-                    logger.warning(f'Plex API returned status code: {response.status_code}')
-            except Exception as e:
-                logger.error(f'Error triggering Plex library refresh: {str(e)}')
+            schedule_plex_refresh(PLEX_SECTION_IDS[content_type])
         else:
             logger.warning('PLEX_TOKEN not configured, skipping library refresh')
         
-        # Remove from active downloads after 30 seconds
-        def cleanup():
-            time.sleep(30)
-            if file_id in active_downloads:
-                del active_downloads[file_id]
-        
-        threading.Thread(target=cleanup, daemon=True).start()
-        
     except Exception as e:
-        logger.error(f'Background download failed: {str(e)}')
-        active_downloads[file_id] = {
-            'status': 'error',
-            'fileName': file_name,
-            'progress': 0,
-            'message': f'Download failed: {str(e)}',
-            'error': str(e)
-        }
+        logger.error('Background download failed: %s', e)
+        _invalidate_downloads_cache()
+        with _downloads_lock:
+            active_downloads[file_id] = {
+                'status': 'error',
+                'fileName': file_name,
+                'progress': 0,
+                'message': f'Download failed: {str(e)}',
+                'error': str(e),
+                'expires_at': time.time() + DOWNLOAD_RETENTION
+            }
+            _downloads_changed.notify_all()
+
+def _download_worker():
+    """Persistent worker that runs queued downloads one at a time"""
+    while True:
+        job = download_queue.get()
+        try:
+            download_file_background(*job)
+        except Exception as e:
+            logger.error('Download worker error: %s', e)
+        finally:
+            download_queue.task_done()
+
+for _ in range(MAX_PARALLEL_DOWNLOADS):
+    threading.Thread(target=_download_worker, daemon=True).start()
 
 @app.route('/api/download', methods=['POST'])
 def download():
@@ -217,30 +439,35 @@ def download():
         if not file_id:
             return jsonify({'success': False, 'error': 'File ID is required'}), 400
         
-        # Determine download path based on content type
-        if content_type == 'series':
-            download_path = SERIES_PATH
-        else:
-            download_path = MOVIES_PATH
+        # Determine download path based on content type, unknown types are treated as movies
+        if content_type not in CONTENT_PATHS:
+            content_type = 'movie'
+        download_path = CONTENT_PATHS[content_type]
         
-        logger.info(f'Downloading {file_name} as {content_type} to {download_path}')
+        logger.info('Downloading %s as %s to %s', file_name, content_type, download_path)
         
-        # Check if already downloading
-        if file_id in active_downloads:
+        # Check if already downloading, otherwise register as queued so progress polls work immediately
+        with _downloads_lock:
+            existing = active_downloads.get(file_id)
+            if existing is None:
+                active_downloads[file_id] = {
+                    'status': 'queued',
+                    'fileName': file_name,
+                    'progress': 0,
+                    'message': 'Waiting for a free download slot...'
+                }
+                _downloads_changed.notify_all()
+        
+        if existing is not None:
             return jsonify({
                 'success': True, 
                 'message': f'Download already in progress: {file_name}',
-                'status': active_downloads[file_id]['status'],
-                'progress': active_downloads[file_id]['progress']
+                'status': existing['status'],
+                'progress': existing['progress']
             })
         
-        # Start background download with correct path
-        download_thread = threading.Thread(
-            target=download_file_background,
-            args=(file_id, file_name, download_path),
-            daemon=True
-        )
-        download_thread.start()
+        # Queue background download with correct path
+        download_queue.put((file_id, file_name, content_type))
         
         return jsonify({
             'success': True, 
@@ -249,72 +476,136 @@ def download():
         })
     
     except Exception as e:
-        logger.error(f'Download error: {str(e)}')
+        logger.error('Download error: %s', e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/download/progress/<file_id>')
 def download_progress(file_id):
     """Get download progress for a specific file"""
     try:
-        if file_id in active_downloads:
-            return jsonify({
+        _sweep_expired_downloads()
+        with _downloads_lock:
+            entry = active_downloads.get(file_id)
+        
+        if entry is not None:
+            return fast_json({
                 'success': True,
-                'download': active_downloads[file_id]
+                'download': entry
             })
         else:
-            return jsonify({
+            return fast_json({
                 'success': False,
                 'error': 'Download not found or completed'
-            }), 404
+            }, status=404)
     
     except Exception as e:
-        logger.error(f'Progress check error: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error('Progress check error: %s', e)
+        return fast_json({'success': False, 'error': str(e)}, status=500)
+
+def _download_event_stream(file_id):
+    """Yield server-sent events for a download until it finishes or disappears"""
+    last_sent = None
+    while True:
+        with _downloads_changed:
+            entry = active_downloads.get(file_id)
+            deadline = time.monotonic() + SSE_HEARTBEAT_INTERVAL
+            # Entries are replaced on every update, so identity tells us whether anything changed.
+            # Every download notifies the condition, so keep waiting until this entry changes
+            # or the heartbeat is due.
+            while entry is not None and entry is last_sent:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _downloads_changed.wait(timeout=remaining)
+                entry = active_downloads.get(file_id)
+        
+        if entry is None:
+            return
+        
+        if entry is last_sent:
+            # Heartbeat keeps proxies from closing an idle connection
+            yield ': keepalive\n\n'
+            continue
+        
+        last_sent = entry
+        yield f'data: {orjson.dumps(entry).decode()}\n\n'
+        
+        if entry.get('status') in ('completed', 'error'):
+            return
+
+@app.route('/api/download/stream/<file_id>')
+def download_stream(file_id):
+    """Stream download progress for a specific file as server-sent events.
+
+    Unknown or queued downloads, and requests beyond MAX_PROGRESS_STREAMS, get
+    204 No Content, which stops the EventSource and sends the client to polling.
+    """
+    with _downloads_lock:
+        entry = active_downloads.get(file_id)
+    
+    if entry is None or entry.get('status') == 'queued':
+        return Response(status=204)
+    
+    if not _progress_streams.acquire(blocking=False):
+        return Response(status=204)
+    
+    response = Response(
+        _download_event_stream(file_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    response.call_on_close(_progress_streams.release)
+    return response
 
 @app.route('/api/downloads')
 def list_downloads():
     """List downloaded files from both movies and series directories"""
     try:
-        files = []
-        
-        # List movies
-        if os.path.exists(MOVIES_PATH):
-            for filename in os.listdir(MOVIES_PATH):
-                filepath = os.path.join(MOVIES_PATH, filename)
-                if os.path.isfile(filepath):
-                    stat = os.stat(filepath)
-                    files.append({
-                        'name': filename,
-                        'size': stat.st_size,
-                        'sizeFormatted': webshare_client._format_file_size(stat.st_size),
-                        'modified': stat.st_mtime,
-                        'type': 'movie',
-                        'typeLabel': '🎬 Movie'
-                    })
-        
-        # List series
-        if os.path.exists(SERIES_PATH):
-            for filename in os.listdir(SERIES_PATH):
-                filepath = os.path.join(SERIES_PATH, filename)
-                if os.path.isfile(filepath):
-                    stat = os.stat(filepath)
-                    files.append({
-                        'name': filename,
-                        'size': stat.st_size,
-                        'sizeFormatted': webshare_client._format_file_size(stat.st_size),
-                        'modified': stat.st_mtime,
-                        'type': 'series',
-                        'typeLabel': '📺 Series'
-                    })
+        _sweep_expired_downloads()
+        
+        # Serve cached listing while neither directory has changed
+        movies_mtime = _dir_mtime(MOVIES_PATH)
+        series_mtime = _dir_mtime(SERIES_PATH)
+        with _downloads_cache_lock:
+            cached_files = _downloads_cache['files']
+            generation = _downloads_cache['generation']
+            cache_valid = (cached_files is not None
+                           and _downloads_cache['movies_mtime'] == movies_mtime
+                           and _downloads_cache['series_mtime'] == series_mtime)
+        if cache_valid:
+            return fast_json({'success': True, 'files': cached_files})
+        
+        # Collect into parallel lists so sorting works on a flat list of floats
+        names, sizes, mtimes, types = [], [], [], []
+        _scan_media_dir(MOVIES_PATH, 'movie', names, sizes, mtimes, types)
+        _scan_media_dir(SERIES_PATH, 'series', names, sizes, mtimes, types)
         
         # Sort by modification time (newest first)
-        files.sort(key=lambda x: x['modified'], reverse=True)
+        order = sorted(range(len(mtimes)), key=mtimes.__getitem__, reverse=True)
+        format_size = webshare_client._format_file_size
+        files = [{
+            'name': names[i],
+            'size': sizes[i],
+            'sizeFormatted': format_size(sizes[i]),
+            'modified': mtimes[i],
+            'type': types[i],
+            'typeLabel': MEDIA_TYPE_LABELS[types[i]]
+        } for i in order]
         
-        return jsonify({'success': True, 'files': files})
+        # Only store the listing if no download finished while we were scanning
+        with _downloads_cache_lock:
+            if _downloads_cache['generation'] == generation:
+                _downloads_cache.update({
+                    'movies_mtime': movies_mtime,
+                    'series_mtime': series_mtime,
+                    'files': files
+                })
+        
+        return fast_json({'success': True, 'files': files})
     
     except Exception as e:
-        logger.error(f'List downloads error: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error('List downloads error: %s', e)
+        return fast_json({'success': False, 'error': str(e)}, status=500)
 
 @app.route('/health')
 def health():
@@ -330,5 +621,12 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('DEBUG', 'False').lower() == 'true'
     
-    logger.info(f'Starting Webshare Search App on port {port}')
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    logger.info('Starting Webshare Search App on port %s', port)
+    if os.environ.get('USE_WAITRESS', 'False').lower() == 'true' and not debug:
+        # Production WSGI server - handlers run in parallel worker threads
+        from waitress import serve
+        threads = int(os.environ.get('WAITRESS_THREADS', 8))
+        logger.info('Serving with waitress using %s threads', threads)
+        serve(app, host='0.0.0.0', port=port, threads=threads)
+    else:
+        app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
@@ -396,7 +396,7 @@ async function initiateDownload(fileId, fileName) {
 
         if (response.success) {
             // Start real progress tracking
-            await trackDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
+            streamDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
         }
     } catch (error) {
         console.error('Download error:', error);
@@ -435,6 +435,54 @@ async function initiateDownload(fileId, fileName) {
     }
 }
 
+// Live progress via server-sent events, falling back to polling for final state
+async function streamDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName) {
+    if (!window.EventSource) {
+        trackDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
+        return;
+    }
+
+    // Poll while queued so a waiting job doesn't hold a stream (and a server thread) open
+    try {
+        const response = await makeRequest(`/api/download/progress/${fileId}`);
+        if (response.success && response.download.status === 'queued') {
+            updateProgress(progressFill, progressText, response.download.progress, response.download.message);
+            setTimeout(() => {
+                streamDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
+            }, 2000);
+            return;
+        }
+    } catch (error) {
+        // Not found or request failed - polling handles both
+        trackDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
+        return;
+    }
+
+    const basePath = window.location.pathname.startsWith('/ws') ? '/ws' : '';
+    const source = new EventSource(`${basePath}/api/download/stream/${encodeURIComponent(fileId)}`);
+    let finished = false;
+
+    const finish = () => {
+        if (finished) return;
+        finished = true;
+        source.close();
+        // Polling handles completed/error/not-found UI states
+        trackDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName);
+    };
+
+    source.onmessage = (event) => {
+        const download = JSON.parse(event.data);
+        updateProgress(progressFill, progressText, download.progress, download.message);
+
+        if (download.status === 'completed' || download.status === 'error') {
+            finish();
+        }
+    };
+
+    // Stream closed, unavailable or refused with 204 because all stream slots are taken
+    source.onerror = finish;
+}
+
 // Real progress tracking function
 async function trackDownloadProgress(fileId, progressFill, progressText, button, originalText, fileName) {
     const progressContainer = progressFill ? progressFill.parentElement.parentElement : null;